@@ -1,8 +1,10 @@
 import pygame
 from pygame.locals import *
+import numpy as np
 import random
+from collections import deque
 from enum import Enum
-from typing import Tuple, List
+from typing import Deque, Tuple, List
 import os
 
 class GameState(Enum):
@@ -25,6 +27,7 @@ class Config:
     # Game mechanics
     PIPE_GAP = 150
     PIPE_FREQUENCY = 1500  # milliseconds
+    MAX_PIPE_PAIRS = 8  # initial capacity of the pipe arrays
     GROUND_HEIGHT = 168  # 936 - 768
     
     # Colors
@@ -40,6 +43,12 @@ class Config:
     MUSIC_VOLUME = 0.7
     SFX_VOLUME = 0.8
 
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a surface to the display pixel format, keeping per-pixel alpha"""
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
 class AssetManager:
     """Handles loading and caching of game assets"""
     
@@ -69,6 +78,9 @@ class AssetManager:
                     # Create placeholder if image doesn't exist
                     self.images[name] = self._create_placeholder(name)
             
+            self._build_pipe_variants()
+            self._build_ground_strip()
+            
             # Load wolf animation frames
             self.images['wolf_frames'] = []
             for i in range(1, 4):
@@ -85,6 +97,19 @@ class AssetManager:
             print(f"Error loading assets: {e}")
             self._create_fallback_assets()
     
+    def _build_pipe_variants(self):
+        """Pre-flip the top pipe once"""
+        self.images['pipe_flipped'] = pygame.transform.flip(self.images['pipe'], False, True).convert()
+    
+    def _build_ground_strip(self):
+        """Tile the ground twice side by side so scrolling never shows a gap"""
+        ground = self.images['ground']
+        width, height = ground.get_size()
+        strip = pygame.Surface((width * 2, height)).convert()
+        strip.blit(ground, (0, 0))
+        strip.blit(ground, (width, 0))
+        self.images['ground_strip'] = strip
+    
     def _load_audio(self):
         """Load audio files with error handling"""
         try:
@@ -119,51 +144,53 @@ class AssetManager:
     
     def _create_placeholder_sound(self):
         """Create a silent placeholder sound"""
-        # Create a very short silent sound
-        sound_array = pygame.sndarray.array([[0, 0]] * 100)
+        # Create a very short silent sound matching the 16-bit stereo mixer
+        sound_array = np.zeros((100, 2), dtype=np.int16)
         return pygame.sndarray.make_sound(sound_array)
     
     def _create_placeholder(self, name: str) -> pygame.Surface:
-        """Create placeholder surfaces for missing assets"""
+        """Create display-format placeholder surfaces for missing assets"""
         if name == 'bg':
             surf = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
             surf.fill((135, 206, 235))  # Sky blue
-            return surf
+            return surf.convert()
         elif name == 'ground':
             surf = pygame.Surface((Config.SCREEN_WIDTH, Config.GROUND_HEIGHT))
             surf.fill((139, 69, 19))  # Brown
-            return surf
+            return surf.convert()
         elif name == 'pipe':
             surf = pygame.Surface((80, 400))
             surf.fill((0, 128, 0))  # Green
-            return surf
+            return surf.convert()
         elif name == 'restart':
             surf = pygame.Surface((100, 50))
             surf.fill((255, 0, 0))  # Red
-            return surf
+            return surf.convert()
         else:
             surf = pygame.Surface((50, 50))
             surf.fill((255, 255, 255))
-            return surf
+            return surf.convert()
     
     def _create_wolf_placeholder(self) -> pygame.Surface:
         """Create placeholder wolf sprite"""
         surf = pygame.Surface((50, 35))
         surf.fill((255, 255, 0))  # Yellow
         surf.set_colorkey((0, 0, 0))
-        return surf
+        return surf.convert()
     
     def _create_fallback_assets(self):
         """Create all assets as fallbacks"""
         for name in ['bg', 'ground', 'restart', 'pipe']:
             self.images[name] = self._create_placeholder(name)
+        self._build_pipe_variants()
+        self._build_ground_strip()
         self.images['wolf_frames'] = [self._create_wolf_placeholder() for _ in range(3)]
         
         # Create placeholder sounds
         for name in ['swoosh', 'point']:
             self.sounds[name] = self._create_placeholder_sound()
 
-class Wolf(pygame.sprite.Sprite):
+class Wolf(pygame.sprite.DirtySprite):
     """Player character class with improved physics and animation"""
     
     def __init__(self, x: int, y: int, asset_manager: AssetManager):
@@ -175,20 +202,42 @@ class Wolf(pygame.sprite.Sprite):
         
         self.image = self.images[self.image_index]
         self.rect = self.image.get_rect(center=(x, y))
-        self.mask = pygame.mask.from_surface(self.image)
         
         # Physics
         self.velocity = 0
-        self.is_clicked = False
         
         # Store original images for rotation
         self.original_images = self.images.copy()
-    
-    def update(self, game_state: GameState):
+        
+        # Pre-rotated sprites and hitboxes keyed by (image_index, angle)
+        self._rot_cache = {}
+        self._hitbox_cache = {}
+        self._build_rotation_cache()
+        self._hitbox_offset = self._hitbox_cache[(self.image_index, 0)]
+        
+        # Rotation currently applied, to skip redundant swaps
+        self._last_angle = None
+        self._last_idx = None
+    
+    def _build_rotation_cache(self):
+        """Pre-render every rotation the wolf can use"""
+        for frame_idx in range(len(self.original_images)):
+            for angle in range(-90, 46):
+                rotated = to_display_format(pygame.transform.rotate(self.original_images[frame_idx], angle))
+                self._rot_cache[(frame_idx, angle)] = rotated
+                # Tight box around the opaque pixels, relative to the sprite's topleft
+                self._hitbox_cache[(frame_idx, angle)] = rotated.get_bounding_rect()
+    
+    @property
+    def hitbox(self) -> pygame.Rect:
+        """Screen rect around the visible part of the current sprite"""
+        return self._hitbox_offset.move(self.rect.topleft)
+    
+    def update(self, game_state: GameState, clicked: bool = False):
         """Update wolf physics and animation"""
         if game_state == GameState.PLAYING:
             self._apply_physics()
-            jump_occurred = self._handle_input()
+            jump_occurred = self._handle_input(clicked)
             self._animate()
             self._rotate_sprite()
             return jump_occurred
@@ -198,23 +247,20 @@ class Wolf(pygame.sprite.Sprite):
     
     def _apply_physics(self):
         """Apply gravity and movement"""
-        self.velocity += Config.GRAVITY
-        self.velocity = min(self.velocity, Config.MAX_FALL_SPEED)
+        velocity = min(self.velocity + Config.GRAVITY, Config.MAX_FALL_SPEED)
+        self.velocity = velocity
         
         # Only move if not hitting ground
-        if self.rect.bottom < Config.SCREEN_HEIGHT - Config.GROUND_HEIGHT:
-            self.rect.y += int(self.velocity)
-    
-    def _handle_input(self):
-        """Handle jump input with proper state tracking"""
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        
-        if mouse_pressed and not self.is_clicked:
-            self.is_clicked = True
+        rect = self.rect
+        if rect.bottom < Config.SCREEN_HEIGHT - Config.GROUND_HEIGHT:
+            rect.y += int(velocity)
+            self.dirty = 1
+    
+    def _handle_input(self, clicked: bool):
+        """Jump on a click captured by the event queue this frame"""
+        if clicked:
             self.velocity = Config.JUMP_STRENGTH
             return True  # Jump occurred
-        elif not mouse_pressed:
-            self.is_clicked = False
         
         return False  # No jump
     
@@ -228,52 +274,52 @@ class Wolf(pygame.sprite.Sprite):
     
     def _rotate_sprite(self):
         """Rotate sprite based on velocity"""
-        angle = max(-90, min(45, self.velocity * -2))
-        self.image = pygame.transform.rotate(self.original_images[self.image_index], angle)
-        
-        # Update rect and mask after rotation
-        old_center = self.rect.center
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
-        self.mask = pygame.mask.from_surface(self.image)
+        angle = max(-90, min(45, int(self.velocity * -2)))
+        self._set_rotation(angle)
     
     def _point_down(self):
         """Point sprite downward when game over"""
-        self.image = pygame.transform.rotate(self.original_images[self.image_index], -90)
+        self._set_rotation(-90)
+    
+    def _set_rotation(self, angle: int):
+        """Swap in the cached sprite and hitbox for the given angle"""
+        if angle == self._last_angle and self.image_index == self._last_idx:
+            return
+        self._last_angle = angle
+        self._last_idx = self.image_index
+        
+        key = (self.image_index, angle)
+        self.image = self._rot_cache[key]
+        self._hitbox_offset = self._hitbox_cache[key]
+        
+        # Update rect after rotation
         old_center = self.rect.center
         self.rect = self.image.get_rect()
         self.rect.center = old_center
-        self.mask = pygame.mask.from_surface(self.image)
+        self.dirty = 1
     
     def reset(self, x: int, y: int):
         """Reset wolf to initial position"""
         self.rect.center = (x, y)
         self.velocity = 0
-        self.is_clicked = False
         self.image_index = 0
         self.animation_counter = 0
+        self.dirty = 1
 
-class Pipe(pygame.sprite.Sprite):
+class Pipe(pygame.sprite.DirtySprite):
     """Pipe obstacle class"""
     
     def __init__(self, x: int, y: int, position: int, asset_manager: AssetManager):
         super().__init__()
-        self.image = asset_manager.images['pipe'].copy()
+        # Pipes never mutate their surface, so share the cached ones
+        self.image = asset_manager.images['pipe_flipped' if position == 1 else 'pipe']
         
         if position == 1:  # Top pipe
-            self.image = pygame.transform.flip(self.image, False, True)
             self.rect = self.image.get_rect(bottomleft=(x, y - Config.PIPE_GAP // 2))
         else:  # Bottom pipe
             self.rect = self.image.get_rect(topleft=(x, y + Config.PIPE_GAP // 2))
         
-        self.mask = pygame.mask.from_surface(self.image)
         self.scored = False
-    
-    def update(self):
-        """Move pipe left and remove when off screen"""
-        self.rect.x -= Config.SCROLL_SPEED
-        if self.rect.right < 0:
-            self.kill()
 
 class Button:
     """UI Button class"""
@@ -281,25 +327,14 @@ class Button:
     def __init__(self, x: int, y: int, image: pygame.Surface):
         self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
-        self.is_pressed = False
     
-    def update(self) -> bool:
-        """Update button state and return if clicked"""
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        
-        if self.rect.collidepoint(mouse_pos):
-            if mouse_pressed and not self.is_pressed:
-                self.is_pressed = True
-                return True
-            elif not mouse_pressed:
-                self.is_pressed = False
-        
-        return False
+    def update(self, mouse_pos: Tuple[int, int], clicked: bool) -> bool:
+        """Return if the button was clicked this frame"""
+        return clicked and self.rect.collidepoint(mouse_pos)
     
-    def draw(self, screen: pygame.Surface):
-        """Draw button to screen"""
-        screen.blit(self.image, self.rect)
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """Draw button to screen and return the covered rect"""
+        return screen.blit(self.image, self.rect)
 
 class AudioManager:
     """Manages game audio including music and sound effects"""
@@ -353,6 +388,9 @@ class AudioManager:
 class Game:
     """Main game class handling game logic and state"""
     
+    # Offsets for a 2 pixel text outline: N, NE, E, SE, S, SW, W, NW
+    OUTLINE_OFFSETS = [(0, -2), (2, -2), (2, 0), (2, 2), (0, 2), (-2, 2), (-2, 0), (-2, -2)]
+    
     def __init__(self):
         pygame.init()
         
@@ -363,9 +401,22 @@ class Game:
         pygame.display.set_caption('Wolfython - Flappy Bird Style')
         self.clock = pygame.time.Clock()
         
+        # Screen areas changed by the last draw, passed to display.update()
+        self._dirty_rects: List[pygame.Rect] = []
+        
+        # Areas covered by the ground and text last frame
+        self._overlay_rects: List[pygame.Rect] = []
+        
         # Try to load a Flappy Bird style font, fallback to system fonts
         self.font = self._load_game_font()
         
+        # Pre-rendered outlined text keyed by (text, color, outline_color)
+        self._text_cache: dict[tuple[str, tuple, tuple], pygame.Surface] = {}
+        
+        # Outlined score digits, composited side by side when drawing the score
+        self._digit_glyphs = {str(d): self._render_outlined_text(str(d), Config.WHITE, Config.BLACK)
+                              for d in range(10)}
+        
         # Assets management
         self.asset_manager = AssetManager()
         
@@ -378,21 +429,38 @@ class Game:
         self.ground_scroll = 0
         self.last_pipe_time = 0
         
+        # Input captured from the event queue: (clicked this frame, mouse position)
+        self._input = (False, (0, 0))
+        
         # Sprite groups
         self.pipe_group = pygame.sprite.Group()
         self.wolf_group = pygame.sprite.Group()
         
+        # Pipes and wolf share one render group so clearing respects layering
+        self.render_group = pygame.sprite.LayeredDirty()
+        self.background = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
+        self.background.blit(self.asset_manager.images['bg'], (0, 0))
+        self.render_group.clear(self.screen, self.background)
+        
+        # Pipe pairs in spawn order; the head is the next pair to score
+        self.pipe_pairs: Deque[Tuple[Pipe, Pipe]] = deque()
+        
+        # Live pipe pairs as struct-of-arrays, slot i matching live_pipe_pairs[i]
+        self.pipe_x = np.zeros(Config.MAX_PIPE_PAIRS, dtype=np.int32)
+        self.pipe_gap_center = np.zeros(Config.MAX_PIPE_PAIRS, dtype=np.int32)
+        self.pipe_n = 0
+        self.live_pipe_pairs: List[Tuple[Pipe, Pipe]] = []
+        self.pipe_width = self.asset_manager.images['pipe'].get_width()
+        
         # Create the character
         self.wolf = Wolf(100, Config.SCREEN_HEIGHT // 2, self.asset_manager)
         self.wolf_group.add(self.wolf)
+        self.render_group.add(self.wolf, layer=1)
         
         # Create the UI
         restart_x = Config.SCREEN_WIDTH // 2 - 50
         restart_y = Config.SCREEN_HEIGHT // 2 - 100
         self.restart_button = Button(restart_x, restart_y, self.asset_manager.images['restart'])
-        
-        # Performance tracking of the game
-        self.pipe_passed = False
     
     def _set_window_icon(self):
         """Set the window icon"""
@@ -443,16 +511,25 @@ class Game:
     
     def handle_events(self):
         """Handle pygame events"""
+        clicked = False
+        mouse_pos = self._input[1]
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
             
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                mouse_pos = event.pos
+            
             if event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:
+                    clicked = True
                 if self.state == GameState.MENU:
                     self.state = GameState.PLAYING
                     self.last_pipe_time = pygame.time.get_ticks() - Config.PIPE_FREQUENCY
                     self.audio_manager.start_music()
         
+        self._input = (clicked, mouse_pos)
         return True
     
     def update(self):
@@ -465,11 +542,12 @@ class Game:
     def _update_playing(self):
         """Update the game during play state"""
         # Update the character's sprites and check for jump
-        jump_occurred = self.wolf.update(self.state)
+        clicked, _ = self._input
+        jump_occurred = self.wolf.update(self.state, clicked)
         if jump_occurred:
             self.audio_manager.play_swoosh()
         
-        self.pipe_group.update()
+        self._scroll_pipes()
         
         # Generate the pipes
         self._generate_pipes()
@@ -485,11 +563,38 @@ class Game:
     
     def _update_game_over(self):
         """Update game during game over state"""
-        self.wolf_group.update(self.state)
+        clicked, mouse_pos = self._input
+        self.wolf_group.update(self.state, clicked)
         
-        if self.restart_button.update():
+        if self.restart_button.update(mouse_pos, clicked):
             self._reset_game()
     
+    def _scroll_pipes(self):
+        """Move all pipes left in one pass and remove those off screen"""
+        n = self.pipe_n
+        if not n:
+            return
+        
+        pipe_x = self.pipe_x[:n]
+        pipe_x -= Config.SCROLL_SPEED
+        
+        # Prune pairs whose right edge has left the screen
+        keep = pipe_x > -self.pipe_width
+        if not keep.all():
+            for i in np.flatnonzero(~keep):
+                for pipe in self.live_pipe_pairs[i]:
+                    pipe.kill()
+            kept = int(keep.sum())
+            self.pipe_x[:kept] = pipe_x[keep]
+            self.pipe_gap_center[:kept] = self.pipe_gap_center[:n][keep]
+            self.live_pipe_pairs = [pair for pair, k in zip(self.live_pipe_pairs, keep) if k]
+            self.pipe_n = n = kept
+        
+        # Sync sprite rects from the array for drawing
+        for (top_pipe, bottom_pipe), x in zip(self.live_pipe_pairs, self.pipe_x[:n].tolist()):
+            top_pipe.rect.x = bottom_pipe.rect.x = x
+            top_pipe.dirty = bottom_pipe.dirty = 1
+    
     def _generate_pipes(self):
         """Generate pipe pairs at intervals"""
         current_time = pygame.time.get_ticks()
@@ -499,66 +604,92 @@ class Game:
             pipe_center_y = Config.SCREEN_HEIGHT // 2 + pipe_height
             
             # Create the pipe pair
-            top_pipe = Pipe(Config.SCREEN_WIDTH, pipe_center_y, 1, self.asset_manager)
-            bottom_pipe = Pipe(Config.SCREEN_WIDTH, pipe_center_y, -1, self.asset_manager)
+            screen_width = Config.SCREEN_WIDTH
+            asset_manager = self.asset_manager
+            top_pipe = Pipe(screen_width, pipe_center_y, 1, asset_manager)
+            bottom_pipe = Pipe(screen_width, pipe_center_y, -1, asset_manager)
             
             self.pipe_group.add(top_pipe, bottom_pipe)
+            self.render_group.add(top_pipe, bottom_pipe, layer=0)
+            self.pipe_pairs.append((top_pipe, bottom_pipe))
+            self._add_pipe_pair(top_pipe, bottom_pipe, screen_width, pipe_center_y)
             self.last_pipe_time = current_time
     
+    def _add_pipe_pair(self, top_pipe: Pipe, bottom_pipe: Pipe, x: int, gap_center: int):
+        """Append a pipe pair to the arrays, growing them when full"""
+        n = self.pipe_n
+        if n == len(self.pipe_x):
+            self.pipe_x = np.resize(self.pipe_x, 2 * n)
+            self.pipe_gap_center = np.resize(self.pipe_gap_center, 2 * n)
+        
+        self.pipe_x[n] = x
+        self.pipe_gap_center[n] = gap_center
+        self.live_pipe_pairs.append((top_pipe, bottom_pipe))
+        self.pipe_n = n + 1
+    
     def _update_ground_scroll(self):
         """Update scrolling ground"""
-        self.ground_scroll -= Config.SCROLL_SPEED
-        if abs(self.ground_scroll) > 35:
-            self.ground_scroll = 0
+        ground_scroll = self.ground_scroll - Config.SCROLL_SPEED
+        if ground_scroll < -35:
+            ground_scroll = 0
+        self.ground_scroll = ground_scroll
     
     def _check_collisions(self):
         """Check for the collisions and the boundaries"""
-        # Check the pipe collisions using masks for pixel-perfect detection
-        for pipe in self.pipe_group:
-            if pygame.sprite.collide_mask(self.wolf, pipe):
+        # Pipes are axis-aligned, so an AABB test of the wolf's hitbox against
+        # the space above and below each gap is exact
+        n = self.pipe_n
+        if n:
+            hitbox = self.wolf.hitbox
+            pipe_x = self.pipe_x[:n]
+            gap_center = self.pipe_gap_center[:n]
+            half_gap = Config.PIPE_GAP // 2
+            hits = ((hitbox.right > pipe_x) & (hitbox.left < pipe_x + self.pipe_width) &
+                    ((hitbox.top < gap_center - half_gap) | (hitbox.bottom > gap_center + half_gap)))
+            
+            if hits.any():
                 self.state = GameState.GAME_OVER
                 self.audio_manager.stop_music_with_effect()
                 return
         
         # Check the boundaries
-        if (self.wolf.rect.top < 0 or 
-            self.wolf.rect.bottom >= Config.SCREEN_HEIGHT - Config.GROUND_HEIGHT):
+        wolf_rect = self.wolf.rect
+        if (wolf_rect.top < 0 or 
+            wolf_rect.bottom >= Config.SCREEN_HEIGHT - Config.GROUND_HEIGHT):
             self.state = GameState.GAME_OVER
             self.audio_manager.stop_music_with_effect()
     
     def _update_score(self):
         """Update and track score"""
-        if not self.pipe_group:
+        pipe_pairs = self.pipe_pairs
+        
+        # Drop pairs that scrolled off screen
+        while pipe_pairs and pipe_pairs[0][0].rect.right < 0:
+            pipe_pairs.popleft()
+        
+        if not pipe_pairs:
             return
         
-        wolf_x = self.wolf.rect.centerx
-        first_pipe = min(self.pipe_group, key=lambda p: p.rect.centerx)
-        
-        # Check if the character is between pipes
-        if (first_pipe.rect.left < wolf_x < first_pipe.rect.right and not self.pipe_passed):
-            self.pipe_passed = True
-        
-        # Score when the character passes pipe
-        if self.pipe_passed and wolf_x > first_pipe.rect.right:
-            if not first_pipe.scored:
-                self.score += 1
-                self.audio_manager.play_point()  # Play point sound
-                first_pipe.scored = True
-                # Mark the pair as scored
-                for pipe in self.pipe_group:
-                    if abs(pipe.rect.centerx - first_pipe.rect.centerx) < 10:
-                        pipe.scored = True
-            self.pipe_passed = False
+        # Score when the character passes the next pair
+        top_pipe, bottom_pipe = pipe_pairs[0]
+        if self.wolf.rect.centerx > top_pipe.rect.right:
+            self.score += 1
+            self.audio_manager.play_point()  # Play point sound
+            top_pipe.scored = bottom_pipe.scored = True
+            pipe_pairs.popleft()
     
     def _reset_game(self):
         """Reset game to initial state"""
         self.state = GameState.MENU
         self.score = 0
         self.ground_scroll = 0
-        self.pipe_passed = False
         
         # Clear pipes
+        self.render_group.remove(self.pipe_group)
         self.pipe_group.empty()
+        self.pipe_pairs.clear()
+        self.live_pipe_pairs.clear()
+        self.pipe_n = 0
         
         # Reset wolf
         self.wolf.reset(100, Config.SCREEN_HEIGHT // 2)
@@ -568,54 +699,89 @@ class Game:
         self.audio_manager.music_paused = False
     
     def draw(self):
-        """Draw all game elements"""
-        # Draw background
-        self.screen.blit(self.asset_manager.images['bg'], (0, 0))
+        """Draw all game elements and record the dirty screen areas"""
+        screen = self.screen
+        
+        # Restore whatever the ground and text covered last frame
+        for rect in self._overlay_rects:
+            self.render_group.repaint_rect(rect)
         
-        # Draw pipes and wolf
-        self.pipe_group.draw(self.screen)
-        self.wolf_group.draw(self.screen)
+        # Draw background, pipes and wolf
+        dirty_rects = self.render_group.draw(screen)
+        overlay_rects = []
         
         # Draw ground
         ground_y = Config.SCREEN_HEIGHT - Config.GROUND_HEIGHT
-        self.screen.blit(self.asset_manager.images['ground'], (self.ground_scroll, ground_y))
+        ground_area = pygame.Rect(-self.ground_scroll, 0, Config.SCREEN_WIDTH, Config.GROUND_HEIGHT)
+        dirty_rects.append(screen.blit(self.asset_manager.images['ground_strip'], (0, ground_y), area=ground_area))
         
         # Draw score with outline effect (like Flappy Bird)
-        self._draw_outlined_text(str(self.score), Config.WHITE, Config.BLACK, 
-                               Config.SCREEN_WIDTH // 2, 50)
+        overlay_rects.append(self._draw_score(Config.SCREEN_WIDTH // 2, 50))
         
         # Draw game over UI
         if self.state == GameState.GAME_OVER:
-            self.restart_button.draw(self.screen)
-            self._draw_outlined_text("Game Over", Config.WHITE, Config.BLACK,
-                                   Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 - 200)
+            overlay_rects.append(self.restart_button.draw(screen))
+            overlay_rects.append(self._draw_outlined_text("Game Over", Config.WHITE, Config.BLACK,
+                                                          Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 - 200))
         
         # Draw menu instructions
         if self.state == GameState.MENU:
-            self._draw_outlined_text("Click to Start", Config.WHITE, Config.BLACK,
-                                   Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 - 200)
+            overlay_rects.append(self._draw_outlined_text("Click to Start", Config.WHITE, Config.BLACK,
+                                                          Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 - 200))
+        
+        dirty_rects.extend(overlay_rects)
+        self._overlay_rects = overlay_rects
+        self._dirty_rects = dirty_rects
     
-    def _draw_outlined_text(self, text: str, color: Tuple[int, int, int], 
-                          outline_color: Tuple[int, int, int], x: int, y: int):
-        """Draw text with outline effect (Flappy Bird style)"""
-        # Draw outline
-        for dx in [-2, -1, 0, 1, 2]:
-            for dy in [-2, -1, 0, 1, 2]:
-                if dx != 0 or dy != 0:
-                    outline_surface = self.font.render(text, True, outline_color)
-                    outline_rect = outline_surface.get_rect(center=(x + dx, y + dy))
-                    self.screen.blit(outline_surface, outline_rect)
+    def _render_outlined_text(self, text: str, color: Tuple[int, int, int],
+                              outline_color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text with outline effect (Flappy Bird style) onto a new surface"""
+        outline_surface = self.font.render(text, True, outline_color)
+        w, h = outline_surface.get_size()
+        surface = pygame.Surface((w + 4, h + 4), pygame.SRCALPHA)
+        
+        # Draw outline at the 8 compass neighbours
+        for dx, dy in self.OUTLINE_OFFSETS:
+            surface.blit(outline_surface, (2 + dx, 2 + dy))
         
         # Draw main text
         text_surface = self.font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=(x, y))
-        self.screen.blit(text_surface, text_rect)
+        surface.blit(text_surface, (2, 2))
+        return surface.convert_alpha()
+    
+    def _draw_outlined_text(self, text: str, color: Tuple[int, int, int], 
+                          outline_color: Tuple[int, int, int], x: int, y: int) -> pygame.Rect:
+        """Draw text with outline effect (Flappy Bird style) and return its rect"""
+        key = (text, color, outline_color)
+        cached = self._text_cache.get(key)
+        
+        if cached is None:
+            cached = self._render_outlined_text(text, color, outline_color)
+            self._text_cache[key] = cached
+        
+        return self.screen.blit(cached, (x - cached.get_width() // 2, y - cached.get_height() // 2))
+    
+    def _draw_score(self, x: int, y: int) -> pygame.Rect:
+        """Draw the score centered at (x, y) from cached digit glyphs and return its rect"""
+        glyphs = [self._digit_glyphs[digit] for digit in str(self.score)]
+        
+        # Neighbouring glyphs overlap by their 4 px of outline padding
+        width = sum(glyph.get_width() for glyph in glyphs) - 4 * (len(glyphs) - 1)
+        height = max(glyph.get_height() for glyph in glyphs)
+        score_rect = pygame.Rect(0, 0, width, height)
+        score_rect.center = (x, y)
+        
+        glyph_x = score_rect.left
+        for glyph in glyphs:
+            self.screen.blit(glyph, (glyph_x, score_rect.top))
+            glyph_x += glyph.get_width() - 4
+        
+        return score_rect
     
     def _draw_text(self, text: str, color: Tuple[int, int, int], x: int, y: int):
         """Draw centered text"""
         text_surface = self.font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=(x, y))
-        self.screen.blit(text_surface, text_rect)
+        self.screen.blit(text_surface, (x - text_surface.get_width() // 2, y - text_surface.get_height() // 2))
     
     def run(self):
         """Main game loop"""
@@ -631,8 +797,8 @@ class Game:
             # Draw
             self.draw()
             
-            # Update display
-            pygame.display.flip()
+            # Update only the changed areas of the display
+            pygame.display.update(self._dirty_rects)
             self.clock.tick(Config.FPS)
         
         pygame.quit()